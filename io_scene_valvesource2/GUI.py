@@ -28,6 +28,25 @@ from .flex import *
 
 vca_icon = 'EDITMODE_HLT'
 
+class ExportChoiceCache:
+	def __init__(self, context):
+		self.revision = State.revision
+		self.exportables = list(getSelectedExportables())
+		self.num_scene_exports = count_exports(context)
+
+		self.single_obs = []
+		self.groups = []
+		for ex in self.exportables:
+			(self.groups if ex.ob_type == 'COLLECTION' else self.single_obs).append(ex)
+		self.groups.sort(key=lambda g: g.name.lower())
+export_choice_cache = {}
+
+def get_export_choice_cache(context):
+	cache = export_choice_cache.get(context.scene.session_uid)
+	if not (cache and cache.revision == State.revision): # selection and export list only change with the depsgraph
+		cache = export_choice_cache[context.scene.session_uid] = ExportChoiceCache(context)
+	return cache
+
 class SMD_MT_ExportChoice(bpy.types.Menu):
 	bl_label = get_id("exportmenu_title")
 
@@ -35,15 +54,16 @@ class SMD_MT_ExportChoice(bpy.types.Menu):
 		l = self.layout
 		l.operator_context = 'EXEC_DEFAULT'
 		
-		exportables = list(getSelectedExportables())
+		cache = get_export_choice_cache(context)
+		exportables = cache.exportables
 		if len(exportables):
-			single_obs = list([ex for ex in exportables if ex.ob_type != 'COLLECTION'])
-			groups = list([ex for ex in exportables if ex.ob_type == 'COLLECTION'])
-			groups.sort(key=lambda g: g.name.lower())
+			single_obs = cache.single_obs
+			groups = cache.groups
 				
 			group_layout = l
+			is_scene_panel = isinstance(self, SMD_PT_Scene)
 			for i,group in enumerate(groups): # always display all possible groups, as an object could be part of several
-				if type(self) == SMD_PT_Scene:
+				if is_scene_panel:
 					if i == 0: group_col = l.column(align=True)
 					if i % 2 == 0: group_layout = group_col.row(align=True)
 				group_layout.operator(SmdExporter.bl_idname, text=group.name, icon='GROUP').collection = group.item.name
@@ -58,7 +78,7 @@ class SMD_MT_ExportChoice(bpy.types.Menu):
 			row.enabled = False
 
 		row = l.row()
-		num_scene_exports = count_exports(context)
+		num_scene_exports = cache.num_scene_exports
 		row.operator(SmdExporter.bl_idname, text=get_id("exportmenu_scene", True).format(num_scene_exports), icon='SCENE_DATA').export_scene = True
 		row.enabled = num_scene_exports > 0
 
@@ -69,6 +89,12 @@ class SMD_PT_Scene(bpy.types.Panel):
 	bl_context = "scene"
 	bl_options = {'DEFAULT_CLOSED'}
 
+	# untranslated labels never change, so look them up once
+	export_format_label = get_id("export_format") + ":"
+	up_axis_label = get_id("up_axis") + ":"
+	smd_format_label = get_id("smd_format") + ":"
+	dmxver_label = get_id("exportpanel_dmxver")
+
 	def draw(self, context):
 		l = self.layout
 		scene = context.scene
@@ -82,10 +108,10 @@ class SMD_PT_Scene(bpy.types.Panel):
 		
 		if State.datamodelEncoding != 0:
 			row = l.row().split(factor=0.33)
-			row.label(text=get_id("export_format") + ":")
+			row.label(text=self.export_format_label)
 			row.row().prop(scene.vs,"export_format",expand=True)
 		row = l.row().split(factor=0.33)
-		row.label(text=get_id("up_axis") + ":")
+		row.label(text=self.up_axis_label)
 		row.row().prop(scene.vs,"up_axis", expand=True)
 		
 		if State.exportFormat == ExportFormat.DMX and bpy.app.debug_value > 0 or scene.vs.use_kv2:
@@ -99,7 +125,7 @@ class SMD_PT_Scene(bpy.types.Panel):
 		if scene.vs.export_format == 'DMX':
 			if State.engineBranch is None:
 				row = l.split(factor=0.33)
-				row.label(text=get_id("exportpanel_dmxver"))
+				row.label(text=self.dmxver_label)
 				row = row.row(align=True)
 				row.prop(scene.vs,"dmx_encoding",text="")
 				row.prop(scene.vs,"dmx_format",text="")
@@ -110,7 +136,7 @@ class SMD_PT_Scene(bpy.types.Panel):
 				col.prop(scene.vs,"dmx_weightlink_threshold",slider=True)
 
 				row = l.row().split(factor=0.33)
-				row.label(text=get_id("smd_format") + ":")
+				row.label(text=self.smd_format_label)
 				row.row().prop(scene.vs,"forward_parity", expand=True)
 				l.row().prop(scene.vs,"model_scale", expand=True)
 				l.row().prop(scene.vs,"bone_swap_forward_axis", expand=True)
@@ -120,7 +146,7 @@ class SMD_PT_Scene(bpy.types.Panel):
 
 		else:
 			row = l.split(factor=0.33)
-			row.label(text=get_id("smd_format") + ":")
+			row.label(text=self.smd_format_label)
 			row.row().prop(scene.vs,"smd_format", expand=True)
 		
 		col = l.column(align=True)
@@ -143,7 +169,7 @@ class SMD_MT_ConfigureScene(bpy.types.Menu):
 class SMD_UL_ExportItems(bpy.types.UIList):
 	def draw_item(self, context, layout, data, exportable, icon, active_data, active_propname, index):
 		item = exportable.item
-		enabled = not (type(item) == bpy.types.Collection and item.vs.mute)
+		enabled = not (isinstance(item, bpy.types.Collection) and item.vs.mute)
 		
 		row = layout.row(align=True)
 		row.alignment = 'LEFT'
@@ -167,12 +193,16 @@ class SMD_UL_ExportItems(bpy.types.UIList):
 			row.label(text=str(num_vca),icon=vca_icon)
 
 class FilterCache:
-	def __init__(self):
-		self.state_objects = State.exportableObjects
+	# sort state, only invalidated when objects are added, removed or renamed
+	names = None
+	order = None
 
+	# filter state, invalidated when the exportable objects or the filter string change
+	state_objects = None
+	valid_indices = None
+	lower_names = None # parallel to valid_indices
 	fname = None
 	filter = None
-	order = None
 gui_cache = {}
 
 class SMD_UL_GroupItems(bpy.types.UIList):
@@ -182,17 +212,43 @@ class SMD_UL_GroupItems(bpy.types.UIList):
 		r.label(text=item.name,translate=False,icon=MakeObjectIcon(item,suffix="_DATA"))
 	
 	def filter_items(self, context, data, propname):
-		fname = self.filter_name.lower()
+		fname = self.filter_name
+		if not fname.islower(): # avoid allocating a copy when the user typed in lowercase
+			fname = fname.lower()
 		cache = gui_cache.get(data)
+		if not cache:
+			cache = gui_cache[data] = FilterCache()
+
+		if cache.state_objects is not State.exportableObjects:
+			names = tuple(ob.name for ob in data.objects)
+			if names != cache.names:
+				cache.names = names
+				cache.order = None
+			cache.valid_indices = [i for i, ob in enumerate(data.objects) if ob.session_uid in State.exportableObjects]
+			cache.lower_names = None
+			cache.fname = None
+			cache.state_objects = State.exportableObjects
+
+		if cache.fname != fname: # object names are unchanged, so only the filter needs rebuilding
+			flag = self.bitflag_filter_item
+			cache.filter = [0] * len(cache.names)
+			if not fname: # the common case; no need to lowercase anything
+				for i in cache.valid_indices:
+					cache.filter[i] = flag
+			else:
+				if cache.lower_names is None:
+					names = (cache.names[i] for i in cache.valid_indices)
+					cache.lower_names = [name if name.islower() else name.lower() for name in names]
+				for i, name in zip(cache.valid_indices, cache.lower_names):
+					if fname in name:
+						cache.filter[i] = flag
+			cache.fname = fname
 
-		if not (cache and cache.fname == fname and cache.state_objects is State.exportableObjects):
-			cache = FilterCache()
-			cache.filter = [self.bitflag_filter_item if ob.session_uid in State.exportableObjects and (not fname or fname in ob.name.lower()) else 0 for ob in data.objects]
+		if not self.use_filter_sort_alpha:
+			return cache.filter, []
+		if cache.order is None:
 			cache.order = bpy.types.UI_UL_list.sort_items_by_name(data.objects)
-			cache.fname = fname
-			gui_cache[data] = cache
-			
-		return cache.filter, cache.order if self.use_filter_sort_alpha else []
+		return cache.filter, cache.order
 
 class SMD_UL_VertexAnimationItem(bpy.types.UIList):
 	def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
@@ -441,7 +497,7 @@ class SMD_PT_Object_Config(bpy.types.Panel):
 			return
 
 		item = active_exportable.item
-		is_group = type(item) == bpy.types.Collection
+		is_group = isinstance(item, bpy.types.Collection)
 
 		if not (is_group and item.vs.mute):
 			l.column().prop(item.vs, "subdir", icon='FILE_FOLDER')
@@ -597,7 +653,7 @@ class SMD_PT_ShapeKeys(ExportableConfigurationPanel):
 	
 	def draw(self, context):
 		item = self.get_item(context)
-		objects = self.unpack_collection(context)
+		shape_objects = [ob for ob in self.unpack_collection(context) if ob.vs.export and hasShapes(ob)]
 
 		col = self.layout
 		col.row().prop(item.vs,"flex_controller_mode",expand=True)
@@ -620,7 +676,9 @@ class SMD_PT_ShapeKeys(ExportableConfigurationPanel):
 			
 			datablocks_dispayed = []
 			
-			for ob in [ob for ob in objects if ob.vs.export and ob.type in shape_types and ob.active_shape_key and ob.data not in datablocks_dispayed]:
+			for ob in shape_objects:
+				if ob.data in datablocks_dispayed:
+					continue
 				if not len(datablocks_dispayed):
 					col.label(text=get_id("exportables_flex_split"))
 					sharpness_col = col.column(align=True)
@@ -637,7 +695,7 @@ class SMD_PT_ShapeKeys(ExportableConfigurationPanel):
 		else:
 			insertCorrectiveUi(col)
 		
-		num_shapes, num_correctives = countShapes(objects)
+		num_shapes, num_correctives = countShapeKeys(shape_objects)
 		
 		col.separator()
 		row = col.row()
@@ -656,7 +714,7 @@ class SMD_PT_VertexMaps(ExportableConfigurationPanel):
 	def draw_header(self, context):
 		title = get_id("vertmap_group_props")
 		item = self.get_item(context)
-		is_collection = type(item) == bpy.types.Collection
+		is_collection = isinstance(item, bpy.types.Collection)
 		if is_collection:
 			member = self.get_active_object(context)
 			if member:
@@ -696,7 +754,7 @@ class SMD_PT_FloatMaps(ExportableConfigurationPanel):
 	def draw_header(self, context):
 		title = get_id("vertmap_group_props_float")
 		item = self.get_item(context)
-		is_collection = type(item) == bpy.types.Collection
+		is_collection = isinstance(item, bpy.types.Collection)
 		if is_collection:
 			member = self.get_active_object(context)
 			if member:
@@ -714,11 +772,11 @@ class SMD_PT_FloatMaps(ExportableConfigurationPanel):
 
 		item = active_exportable.item
 		print(item)
-		is_group = type(item) == bpy.types.Collection
+		is_group = isinstance(item, bpy.types.Collection)
 
 		col = l.column()
 
-		objects = State.exportableObjects.intersection(item.objects) if is_group else [item]
+		objects = [ob for ob in item.objects if ob.session_uid in State.exportableObjects] if is_group else [item]
 
 		if context.active_object:
 			if context.active_object.type == 'MESH':
@@ -796,7 +854,7 @@ class SMD_PT_Scene_QC_Complie(bpy.types.Panel):
 	searchPath = None
 	lastPathRow = None
 	qcFiles = None
-	lastUpdate = 0.0
+	qcDirMtime = None
 		
 	def draw(self,context):
 		l = self.layout
@@ -826,10 +884,12 @@ class SMD_PT_Scene_QC_Complie(bpy.types.Panel):
 		
 		# QCs
 		filesRow = l.row()
-		if scene.vs.qc_path != self.searchPath or self.qcFiles is None or time.time() > self.lastUpdate + 2:
+		qc_dir = os.path.dirname(bpy.path.abspath(scene.vs.qc_path))
+		qc_dir_mtime = os.stat(qc_dir).st_mtime_ns if os.path.exists(qc_dir) else None
+		if scene.vs.qc_path != self.searchPath or self.qcFiles is None or qc_dir_mtime != self.qcDirMtime: # only rescan when the directory changes
 			self.qcFiles = SMD_OT_Compile.getQCs()
 			self.searchPath = scene.vs.qc_path
-		self.lastUpdate = time.time()
+			self.qcDirMtime = qc_dir_mtime
 	
 		if self.qcFiles:
 			c = l.column_flow(columns=2)
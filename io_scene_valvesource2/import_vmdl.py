@@ -24,11 +24,26 @@ import re
 from bpy_extras.io_utils import ImportHelper
 from mathutils import Euler
 
-
-def parse_vmdl_attachments(filepath):
+# Captures every field of an 'Attachment' block in one pass. The [^}] runs keep each match inside its own block.
+# Matches raw bytes so that only the captured fields ever need decoding.
+_ATTACHMENT_RE = re.compile(
+    rb'{\s*_class = "Attachment"'
+    rb'[^}]*?\bname\s*=\s*"(?P<name>[^"]*)"'
+    rb'(?:[^}]*?parent_bone\s*=\s*"(?P<bone>[^"]*)")?'
+    rb'[^}]*?origin\s*=\s*\[(?P<origin>[^\]]*)\]'
+    rb'[^}]*?angles\s*=\s*\[(?P<angles>[^\]]*)\]'
+)
+
+_TARGET_ATTACHMENT_NAMES = frozenset({
+    "far_00", "far_01", "far_02",
+    "near_00", "near_01", "near_02",
+    "gunaim_00", "gunaim_01", "gunaim_02"
+})
+
+
+def parse_vmdl_attachments(filepath, name_whitelist=None):
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            # Read the entire content as a single string, necessary for re.DOTALL
+        with open(filepath, 'rb') as f:
             content = f.read()
     except Exception as e:
         print(f"Error reading file: {e}")
@@ -36,53 +51,28 @@ def parse_vmdl_attachments(filepath):
 
     attachments_data = []
 
-    # Regex to capture the entire 'Attachment' block, including newlines (re.DOTALL)
-    attachment_pattern = re.compile(
-        r'{\s*_class = "Attachment"(.*?)}',
-        re.DOTALL
-    )
-
-    array_pattern = re.compile(
-        r'(relative_origin|relative_angles|origin|angles)\s+=\s*\[(.*?)\]',
-        re.DOTALL | re.IGNORECASE
-    )
-
-    for block in attachment_pattern.findall(content):
-        attachment = {}
+    for match in _ATTACHMENT_RE.finditer(content):
+        name = match.group('name').decode('utf-8', errors='replace')
+        if name_whitelist is not None and name not in name_whitelist:
+            continue
 
-        name_match = re.search(r'name\s+=\s+"(.*?)"', block)
-        if name_match:
-            attachment['name'] = name_match.group(1)
+        attachment = {'name': name}
 
-        bone_match = re.search(r'parent_bone\s+=\s+"(.*?)"', block)
-        if bone_match:
-            attachment['parent_bone'] = bone_match.group(1)
+        bone = match.group('bone')
+        if bone is not None:
+            attachment['parent_bone'] = bone.decode('utf-8', errors='replace')
 
-
-        for match in array_pattern.finditer(block):
-            key = match.group(1).lower()
-            array_content = match.group(2)  # The raw content inside the brackets
-
-            coords = []
+        for key in ('origin', 'angles'):
+            array_content = match.group(key)  # The raw content inside the brackets
             try:
-                coords = [
-                    float(c.strip())
-                    for c in array_content.split(',')
-                    if c.strip()
-                ]
+                # split() with no argument already discards empty tokens and surrounding whitespace; float() accepts bytes
+                attachment[key] = list(map(float, array_content.replace(b',', b' ').split()))
             except ValueError:
                 print(
-                    f"Warning: Could not convert coordinates for {key} in attachment {attachment.get('name', 'UNKNOWN')}.")
-                continue
-
-            if 'origin' in key:
-                attachment['origin'] = coords
-            elif 'angles' in key:
-                attachment['angles'] = coords
-
+                    f"Warning: Could not convert coordinates for {key} in attachment {attachment['name']}.")
+                break
 
-        if 'name' in attachment and 'origin' in attachment and len(
-                attachment['origin']) == 3 and 'angles' in attachment and len(attachment['angles']) == 3:
+        if len(attachment.get('origin', ())) == 3 and len(attachment.get('angles', ())) == 3:
             attachments_data.append(attachment)
 
     return attachments_data
@@ -94,12 +84,6 @@ class VmdlAttachmentImporter(bpy.types.Operator, ImportHelper):
     bl_description = "Import Deadlock VMDL attachment data and generate attachment points."
     bl_options = {'UNDO', 'PRESET'}
 
-    TARGET_ATTACHMENT_NAMES = {
-        "far_00", "far_01", "far_02",
-        "near_00", "near_01", "near_02",
-        "gunaim_00", "gunaim_01", "gunaim_02"
-    }
-
     # File browser properties
     filepath: bpy.props.StringProperty(name="File Path", maxlen=1024, default="", options={'HIDDEN'})
     filter_glob: bpy.props.StringProperty(default="*.vmdl", options={'HIDDEN'})
@@ -119,16 +103,11 @@ class VmdlAttachmentImporter(bpy.types.Operator, ImportHelper):
             self.report({'ERROR'}, "No file selected.")
             return {'CANCELLED'}
 
-        attachments_data = parse_vmdl_attachments(self.filepath)
-
-        filtered_attachments = attachments_data
-
-        if self.filter_mode == 'WEAPON_POINTS':
-            filtered_attachments = [
-                att for att in attachments_data
-                if att.get('name') in self.TARGET_ATTACHMENT_NAMES
-            ]
+        weapon_points = self.filter_mode == 'WEAPON_POINTS'
+        filtered_attachments = parse_vmdl_attachments(
+            self.filepath, _TARGET_ATTACHMENT_NAMES if weapon_points else None)
 
+        if weapon_points:
             if not filtered_attachments:
                 self.report({'WARNING'}, "Filter is active, but no matching weapon attachments were found in the file.")
                 return {'FINISHED'}
@@ -157,35 +136,28 @@ class VmdlAttachmentImporter(bpy.types.Operator, ImportHelper):
         else:
             attachment_collection = bpy.data.collections[collection_name]
 
+        rotation = Euler((0.0, 0.0, 0.0), 'YZX') # scratch value, copied into each empty on assignment
+        radians = math.radians
+        empties = []
+
         for att in attachments_data:
             name = att["name"]
-            origin_coords = att["origin"]
             angle_coords = att["angles"]
+            rotation.x = radians(angle_coords[0])
+            rotation.y = radians(angle_coords[1])
+            rotation.z = radians(angle_coords[2])
 
-            location = (
-                origin_coords[0],
-                origin_coords[1],
-                origin_coords[2],
-            )
-
-            rotation = Euler((
-                math.radians(angle_coords[0]),
-                math.radians(angle_coords[1]),
-                math.radians(angle_coords[2]),
-            ), 'YZX')
-
-
-            bpy.ops.object.empty_add(type='SINGLE_ARROW', location=location)
-            att_empty = context.active_object
-            att_empty.name = name
+            # Create the empty directly; bpy.ops.object.empty_add pushes undo and syncs the view layer for every call
+            att_empty = bpy.data.objects.new(name, None)
+            att_empty.empty_display_type = 'SINGLE_ARROW'
             att_empty.empty_display_size = 80.0
-
+            att_empty.location = att["origin"]
             att_empty.rotation_euler = rotation
+            empties.append(att_empty)
 
-            for col in att_empty.users_collection:
-                if col.name == "Collection":
-                    continue
-                col.objects.unlink(att_empty)
+        # Link only once every empty is fully set up, so the view layer is synced a single time at the end
+        for att_empty in empties:
             attachment_collection.objects.link(att_empty)
+            self.report({'INFO'}, f"Created standalone attachment point '{att_empty.name}'.")
 
-            self.report({'INFO'}, f"Created standalone attachment point '{name}'.")
\ No newline at end of file
+        context.view_layer.update()
\ No newline at end of file
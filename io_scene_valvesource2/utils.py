@@ -116,14 +116,18 @@ dmx_versions_source2 = {
 
 class _StateMeta(type): # class properties are not supported below Python 3.9, so we use a metaclass instead
 	def __init__(cls, *args, **kwargs):
-		cls._exportableObjects = set()
+		cls._exportableObjects = frozenset()
 		cls.last_export_refresh = 0
+		cls._revision = 0
 		cls._engineBranch = None
 		cls._gamePathValid = False
 
 	@property
 	def exportableObjects(cls): return cls._exportableObjects
 
+	@property
+	def revision(cls): return cls._revision # incremented on every depsgraph update or export list refresh
+
 	@property
 	def engineBranch(cls) -> dmx_version: return cls._engineBranch
 
@@ -157,13 +161,15 @@ class State(metaclass=_StateMeta):
 	@classmethod
 	def update_scene(cls, scene = None):
 		scene = scene or bpy.context.scene
-		cls._exportableObjects = set([ob.session_uid for ob in scene.objects if ob.type in exportable_types and not (ob.type == 'CURVE' and ob.data.bevel_depth == 0 and ob.data.extrude == 0)])
+		cls._exportableObjects = frozenset(ob.session_uid for ob in scene.objects if ob.type in exportable_types and not (ob.type == 'CURVE' and ob.data.bevel_depth == 0 and ob.data.extrude == 0))
 		make_export_list(scene)
 		cls.last_export_refresh = time.time()
+		cls._revision += 1
 	
 	@staticmethod
 	@persistent
 	def _onDepsgraphUpdate(scene):
+		State._revision += 1
 		if scene == bpy.context.scene and time.time() - State.last_export_refresh > 0.25:
 			State.update_scene(scene)
 
@@ -496,8 +502,6 @@ def hasShapes(id, valid_only = True):
 		return _test(id)
 
 def countShapes(*objects):
-	num_shapes = 0
-	num_correctives = 0
 	flattened_objects = []
 	for ob in objects:
 		if type(ob) == bpy.types.Collection:
@@ -506,10 +510,29 @@ def countShapes(*objects):
 			flattened_objects.extend(ob)
 		else:
 			flattened_objects.append(ob)
-	for ob in [ob for ob in flattened_objects if ob.vs.export and hasShapes(ob)]:
-		for shape in ob.data.shape_keys.key_blocks[1:]:
-			if getCorrectiveShapeSeparator() in shape.name: num_correctives += 1
-			else: num_shapes += 1
+	return countShapeKeys([ob for ob in flattened_objects if ob.vs.export and hasShapes(ob)])
+
+_shape_count_cache = {}
+
+def countShapeKeys(objects):
+	"""Counts the shapes and correctives of objects already known to be exported and to have shapes."""
+	if _shape_count_cache.get("revision") != State.revision: # shape keys can only have changed after a depsgraph update
+		_shape_count_cache.clear()
+		_shape_count_cache["revision"] = State.revision
+
+	separator = getCorrectiveShapeSeparator()
+	num_shapes = 0
+	num_correctives = 0
+	for ob in objects:
+		key_blocks = ob.data.shape_keys.key_blocks
+		cache_key = (ob.data.session_uid, separator)
+		counts = _shape_count_cache.get(cache_key)
+		if counts is None or counts[2] != len(key_blocks):
+			names = [shape.name for shape in key_blocks[1:]]
+			ob_correctives = sum(1 for name in names if separator in name)
+			counts = _shape_count_cache[cache_key] = (len(names) - ob_correctives, ob_correctives, len(key_blocks))
+		num_shapes += counts[0]
+		num_correctives += counts[1]
 	return num_shapes, num_correctives
 
 def hasCurves(id):
@@ -588,7 +611,7 @@ def make_export_list(scene):
 		return os.path.join(item.vs.subdir if item.vs.subdir != "." else "", (name if name else item.name) + getFileExt())
 	
 	if State.exportableObjects:
-		ungrouped_object_ids = State.exportableObjects.copy()
+		ungrouped_object_ids = set(State.exportableObjects)
 		
 		groups_sorted = bpy.data.collections[:]
 		groups_sorted.sort(key=lambda g: g.name.lower())